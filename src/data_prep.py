@@ -1,9 +1,30 @@
+import os
+from functools import lru_cache
+
 import pandas as pd
 
 
-def load_news(path):
+def _parse_news(path):
     df = pd.read_csv(path)
-    df['date'] = pd.to_datetime(df['date'], utc=True, errors='coerce')
+    df['date'] = pd.to_datetime(df['date'], utc=True, errors='coerce',
+                                format='ISO8601')
     df['headline'] = df['headline'].astype(str)
     df['publisher'] = df['publisher'].astype(str)
     return df
+
+
+# Keeps the last parsed file alive for the process alongside the caller's
+# copy; call _read_news.cache_clear() to release it.
+@lru_cache(maxsize=1)
+def _read_news(path, mtime_ns, size):
+    return _parse_news(path)
+
+
+def load_news(path):
+    # Local files are cached per (file, mtime, size); callers get their own
+    # copy. Buffers and URLs are parsed directly.
+    if isinstance(path, (str, os.PathLike)) and os.path.isfile(path):
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        return _read_news(path, st.st_mtime_ns, st.st_size).copy()
+    return _parse_news(path)
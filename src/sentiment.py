@@ -1,9 +1,22 @@
 # src/sentiment.py
 
+from functools import lru_cache
+
 import nltk
+import numpy as np
+import pandas as pd
 from nltk.sentiment.vader import SentimentIntensityAnalyzer
 
 
+@lru_cache(maxsize=1)
+def _get_sia() -> SentimentIntensityAnalyzer:
+    """
+    Download the VADER lexicon and build the shared analyzer on first use.
+    """
+    nltk.download("vader_lexicon", quiet=True)
+    return SentimentIntensityAnalyzer()
+
+
 class SentimentAnalyzer:
     """
     Wrapper around NLTK's VADER SentimentIntensityAnalyzer
@@ -12,10 +25,9 @@ class SentimentAnalyzer:
 
     def __init__(self):
         """
-        Initialize the VADER sentiment analyzer and download necessary lexicon.
+        Initialize the VADER sentiment analyzer, reusing the shared instance.
         """
-        nltk.download("vader_lexicon", quiet=True)
-        self.sia = SentimentIntensityAnalyzer()
+        self.sia = _get_sia()
 
     def score(self, text: str) -> float:
         """
@@ -31,3 +43,41 @@ class SentimentAnalyzer:
         if not isinstance(text, str):
             return 0.0
         return self.sia.polarity_scores(text)['compound']
+
+    def score_batch(self, texts) -> np.ndarray:
+        """
+        Compute compound sentiment scores for a sequence of texts.
+
+        Args:
+            texts (array-like): The texts to score.
+
+        Returns:
+            np.ndarray: float32 array of scores, one per input text.
+                        Non-string inputs score 0.0.
+        """
+        polarity_scores = self.sia.polarity_scores
+        out = np.zeros(len(texts), dtype=np.float32)
+        for i, text in enumerate(texts):
+            if isinstance(text, str):
+                out[i] = polarity_scores(text)['compound']
+        return out
+
+    def score_series(self, texts: pd.Series) -> pd.Series:
+        """
+        Compute compound sentiment scores for a Series of texts.
+
+        Each distinct text is scored once and the result broadcast back,
+        so republished headlines do not pay for VADER again.
+
+        Args:
+            texts (pd.Series): The texts to score.
+
+        Returns:
+            pd.Series: float32 scores aligned to the input index.
+        """
+        codes, uniques = pd.factorize(texts)
+        scores = self.score_batch(uniques)
+        out = np.zeros(len(codes), dtype=np.float32)
+        mask = codes >= 0
+        out[mask] = scores[codes[mask]]
+        return pd.Series(out, index=texts.index, name=texts.name)
@@ -0,0 +1,39 @@
+import io
+
+from src.data_prep import load_news
+
+
+def test_load_news_parses_mixed_offsets(tmp_path):
+    path = tmp_path / "news.csv"
+    path.write_text(
+        "headline,publisher,date\n"
+        "Stocks rally,Benzinga,2020-06-05 10:30:54-04:00\n"
+        "Stocks fall,Reuters,2020-05-22 00:00:00\n"
+    )
+    df = load_news(path)
+    assert str(df['date'].dt.tz) == "UTC"
+    assert df['date'].notna().all()
+    assert df['date'].iloc[0].hour == 14
+
+
+def test_load_news_returns_independent_copies(tmp_path):
+    path = tmp_path / "news.csv"
+    path.write_text("headline,publisher,date\nStocks rally,Benzinga,2020-06-05\n")
+    first = load_news(path)
+    first.loc[0, 'headline'] = "changed"
+    assert load_news(path).loc[0, 'headline'] == "Stocks rally"
+
+
+def test_load_news_rereads_modified_file(tmp_path):
+    path = tmp_path / "news.csv"
+    path.write_text("headline,publisher,date\nStocks rally,Benzinga,2020-06-05\n")
+    load_news(path)
+    path.write_text("headline,publisher,date\nStocks fall,Reuters,2020-06-06\n")
+    assert load_news(path).loc[0, 'headline'] == "Stocks fall"
+
+
+def test_load_news_from_buffer():
+    buf = io.StringIO("headline,publisher,date\nStocks rally,Benzinga,2020-06-05\n")
+    df = load_news(buf)
+    assert df.loc[0, 'headline'] == "Stocks rally"
+    assert str(df['date'].dt.tz) == "UTC"
@@ -1,3 +1,6 @@
+import pandas as pd
+import pytest
+
 from src.sentiment import SentimentAnalyzer
 
 
@@ -16,3 +19,42 @@ def test_non_string_input():
     analyzer = SentimentAnalyzer()
     assert analyzer.score(None) == 0.0
     assert analyzer.score(123) == 0.0
+
+
+def test_score_batch_matches_score():
+    analyzer = SentimentAnalyzer()
+    texts = ["I love this!", "This is bad", None]
+    scores = analyzer.score_batch(texts)
+    assert scores.dtype == "float32"
+    expected = [analyzer.score(t) for t in texts]
+    assert scores.tolist() == pytest.approx(expected, abs=1e-6)
+
+
+def test_score_series_matches_batch():
+    analyzer = SentimentAnalyzer()
+    texts = pd.Series(["good news", None, "bad news", "good news"],
+                      index=[10, 11, 12, 13], name="headline")
+    scores = analyzer.score_series(texts)
+    assert scores.index.tolist() == [10, 11, 12, 13]
+    assert scores.name == "headline"
+    assert scores[11] == 0.0
+    assert scores.tolist() == pytest.approx(
+        analyzer.score_batch(texts.tolist()).tolist())
+
+
+def test_score_series_scores_each_distinct_text_once(monkeypatch):
+    analyzer = SentimentAnalyzer()
+    polarity_scores = analyzer.sia.polarity_scores
+    calls = []
+
+    def counting(text):
+        calls.append(text)
+        return polarity_scores(text)
+
+    monkeypatch.setattr(analyzer.sia, "polarity_scores", counting)
+    analyzer.score_series(pd.Series(["good news", None, "bad news", "good news"]))
+    assert sorted(calls) == ["bad news", "good news"]
+
+
+def test_analyzers_share_lexicon():
+    assert SentimentAnalyzer().sia is SentimentAnalyzer().sia